@@ -3,10 +3,10 @@ from . import calc
 
 
 class CalcTests(SimpleTestCase):
-    def test_add_nimbers(self):
+    def test_add_numbers(self):
         res = calc.add(5, 6)
         self.assertEqual(res, 11)
 
     def test_subtract_numbers(self):
-        res = calc.subtract(5, 10)
+        res = calc.subtract(10, 5)
         self.assertEqual(res, 5)
@@ -8,7 +8,7 @@ import django.db.models.deletion
 class Migration(migrations.Migration):
 
     dependencies = [
-        ('core', '0004_auto_20230505_0111'),
+        ('core', '0001_initial_squashed_0004_auto_20230505_0111'),
     ]
 
     operations = [
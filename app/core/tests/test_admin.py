@@ -4,6 +4,8 @@ from django.test import TestCase, Client
 from django.contrib.auth import get_user_model
 from django.urls import reverse
 
+from core.tests.factories import create_user
+
 
 class AdminSiteTests(TestCase):
     """Tests for django admin"""
@@ -17,11 +19,7 @@ class AdminSiteTests(TestCase):
             password='123',
         )
         self.client.force_login(self.admin_user)
-        self.user = get_user_model().objects.create_user(
-            email='user@example.com',
-            password='123',
-            name='Test User'
-        )
+        self.user = create_user(name='Test User')
 
     def test_users_list(self):
         """Test that users are listed on page"""
@@ -10,11 +10,12 @@ from rest_framework.test import APIClient
 class HealthCheckTests(TestCase):
     """Test the health check API"""
 
+    client_class = APIClient
+
     def test_health_check(self):
         """Test health check API"""
 
-        client = APIClient()
         url = reverse('health-check')
-        res = client.get(url)
+        res = self.client.get(url)
 
         self.assertEqual(res.status_code, status.HTTP_200_OK)
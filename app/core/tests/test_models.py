@@ -2,21 +2,41 @@
 
 from unittest.mock import patch
 from decimal import Decimal
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from django.contrib.auth import get_user_model
 
 from core import models
+from core.tests.factories import create_user
 
 
-def create_user(email='test@example.com', password='testpass123'):
-    """Create and return a new user"""
-    return get_user_model().objects.create_user(email, password)
+class ModelSimpleTests(SimpleTestCase):
+    """Test model logic that never reaches the database."""
+
+    def test_new_user_without_email_raises_error(self):
+        """Test that creating a user without an email raises a ValueError"""
+
+        with self.assertRaises(ValueError):
+            get_user_model().objects.create_user('', 'test123')
+
+    @patch('core.models.uuid.uuid4')
+    def test_recipe_file_name_uuid(self, mock_uuid):
+        """Test generating image path"""
+
+        uuid = 'test-uuid'
+        mock_uuid.return_value = uuid
+        file_path = models.recipe_image_file_path(None, 'example.jpg')
+
+        self.assertEqual(file_path, f'uploads/recipe/{uuid}.jpg')
 
 
 class ModelTests(TestCase):
     """Test Models."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
     def test_create_user_with_email_successful(self):
         """Test creating a user with an email is successful"""
 
@@ -42,14 +62,9 @@ class ModelTests(TestCase):
         ]
 
         for email, expected in emails:
-            user = get_user_model().objects.create_user(email, 'user123')
-            self.assertEqual(user.email, expected)
-
-    def test_new_user_without_email_raises_error(self):
-        """Test that creating a user without an email raises a ValueError"""
-
-        with self.assertRaises(ValueError):
-            get_user_model().objects.create_user('', 'test123')
+            with self.subTest(email=email):
+                user = get_user_model().objects.create_user(email, 'user123')
+                self.assertEqual(user.email, expected)
 
     def test_create_superuser(self):
         """Test creating a superuser"""
@@ -65,13 +80,8 @@ class ModelTests(TestCase):
     def test_create_recipe(self):
         """Test creating a recipe is successful"""
 
-        user = get_user_model().objects.create_user(
-            'test@example.com',
-            'testpass123'
-        )
-
         recipe = models.Recipe.objects.create(
-            user=user,
+            user=self.user,
             title='Sample recipe name',
             time_minutes=5,
             price=Decimal('5.50'),
@@ -82,25 +92,13 @@ class ModelTests(TestCase):
 
     def test_create_tag(self):
         """Test creating a tag"""
-        user = create_user()
-        tag = models.Tag.objects.create(user=user, name='Tag1')
+        tag = models.Tag.objects.create(user=self.user, name='Tag1')
         self.assertEqual(tag.name, str(tag))
 
     def test_create_ingredient(self):
         """Test creating an ingredient"""
-        user = create_user()
         ingredient = models.Ingredient.objects.create(
-            user=user,
+            user=self.user,
             name='meat'
         )
         self.assertEqual(ingredient.name, str(ingredient))
-
-    @patch('core.models.uuid.uuid4')
-    def test_recipe_file_name_uuid(self, mock_uuid):
-        """Test generating image path"""
-
-        uuid = 'test-uuid'
-        mock_uuid.return_value = uuid
-        file_path = models.recipe_image_file_path(None, 'example.jpg')
-
-        self.assertEqual(file_path, f'uploads/recipe/{uuid}.jpg')
@@ -2,9 +2,8 @@
 
 from decimal import Decimal
 
-from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -13,27 +12,25 @@ from core.models import (
     Ingredient,
     Recipe
 )
+from core.tests.factories import create_user
 from recipe.serializers import IngredientSerializer
 
 
 INGREDIENT_URL = reverse('recipe:ingredient-list')
+INGREDIENT_DETAIL_URL = reverse(
+    'recipe:ingredient-detail', args=[0]
+).replace('/0/', '/%d/')
 
 
 def detail_url(ingredient_id):
     """Create and return ingredient detail url"""
-    return reverse('recipe:ingredient-detail', args=[ingredient_id])
+    return INGREDIENT_DETAIL_URL % ingredient_id
 
 
-def create_user(email='test@example.com', password='testpass123'):
-    """Create and return user"""
-    return get_user_model().objects.create_user(email, password)
+class PublicIngredientApiTests(SimpleTestCase):
+    """Test unauthenticated API requests (rejected before any query)"""
 
-
-class PublicIngredientApiTests(TestCase):
-    """Test unauthenticated API requests"""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test auth is required for retrieveing ingredients"""
@@ -44,9 +41,14 @@ class PublicIngredientApiTests(TestCase):
 class PrivateIngredientsApiTests(TestCase):
     """Test authenticated API requests"""
 
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.other_user = create_user(email='other@example.com')
+
     def setUp(self):
-        self.client = APIClient()
-        self.user = create_user()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredients(self):
@@ -67,8 +69,7 @@ class PrivateIngredientsApiTests(TestCase):
     def test_ingredients_limited_to_user(self):
         """Test list of ingredients is limited to authenticated user"""
 
-        user2 = create_user(email='user2@example.com', password='pass123')
-        Ingredient.objects.create(user=user2, name='Salt')
+        Ingredient.objects.create(user=self.other_user, name='Salt')
         ingredient = Ingredient.objects.create(user=self.user, name='Pepper')
 
         res = self.client.get(INGREDIENT_URL)
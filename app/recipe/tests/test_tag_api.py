@@ -2,9 +2,8 @@
 
 from decimal import Decimal
 
-from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -13,28 +12,26 @@ from core.models import (
     Tag,
     Recipe
 )
+from core.tests.factories import create_user
 
 from recipe.serializers import TagSerializer
 
 
 TAGS_URL = reverse('recipe:tag-list')
+TAG_DETAIL_URL = reverse(
+    'recipe:tag-detail', args=[0]
+).replace('/0/', '/%d/')
 
 
 def detail_url(tag_id):
     """Create and return tag detail url"""
-    return reverse('recipe:tag-detail', args=[tag_id])
+    return TAG_DETAIL_URL % tag_id
 
 
-def create_user(email='user@example.com', password='testpass123'):
-    """Create and return a test user"""
-    return get_user_model().objects.create_user(email, password)
+class PublicTagsApiTests(SimpleTestCase):
+    """Test unauthenticated API requests (rejected before any query)"""
 
-
-class PublicTagsApiTests(TestCase):
-    """Test unauthenticated API requests"""
-
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_auth_required(self):
         """Test auth is required for retrieving tags"""
@@ -46,9 +43,14 @@ class PublicTagsApiTests(TestCase):
 class PrivateTagsApiTests(TestCase):
     """Test authenticated api requests"""
 
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+        cls.other_user = create_user(email='other@example.com')
+
     def setUp(self):
-        self.user = create_user()
-        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
@@ -65,16 +67,16 @@ class PrivateTagsApiTests(TestCase):
 
         res = self.client.get(TAGS_URL)
 
-        tags = Tag.objects.all().order_by('-name')
-        serializer = TagSerializer(tags, many=True)
+        tag_ids = Tag.objects.filter(
+            user=self.user
+        ).order_by('-name').values_list('id', flat=True)
         self.assertEqual(res.status_code, status.HTTP_200_OK)
-        self.assertEqual(res.data, serializer.data)
+        self.assertEqual([t['id'] for t in res.data], list(tag_ids))
 
     def test_tags_limited_to_user(self):
         """Test list of tags is limited to authenticated user"""
 
-        user2 = create_user(email='user2@example.com', password='testpass2123')
-        Tag.objects.create(user=user2, name='Fruity')
+        Tag.objects.create(user=self.other_user, name='Fruity')
 
         tag = Tag.objects.create(user=self.user, name='Comfort Food')
 
@@ -7,23 +7,18 @@ from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from core.tests.factories import create_user
+
 
 CREATE_USER_URL = reverse('user:create')
 TOKEN_URL = reverse('user:token')
 ME_URL = reverse('user:me')
 
 
-def create_user(**param):
-    """Create and return a new user"""
-
-    return get_user_model().objects.create_user(**param)
-
-
 class PublicUserApiTests(TestCase):
     """Test the public features of the user API"""
 
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_create_user_success(self):
         """Test creating a user is successful"""
@@ -127,13 +122,14 @@ class PublicUserApiTests(TestCase):
 class PrivateUserApiTest(TestCase):
     """Test API requests that require authentication"""
 
+    client_class = APIClient
+
     def setUp(self):
         self.user = create_user(
             email='test@example.com',
             password='testpass123',
             name='Test Name'
         )
-        self.client = APIClient()
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_profile_success(self):